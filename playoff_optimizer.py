@@ -10,12 +10,154 @@ This script optimizes fantasy football lineups for a playoff league where:
 - Broncos and Seahawks have first-round byes
 """
 
-import csv
 import os
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
-@dataclass
+import numpy as np
+import pandas as pd
+
+try:
+    import pulp
+except ImportError:
+    pulp = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Lineup slots per position (1 QB, 3 RB, 3 WR, 2 TE) and their fixed order
+POSITION_SLOTS = {
+    'QB': ['QB'],
+    'RB': ['RB1', 'RB2', 'RB3'],
+    'WR': ['WR1', 'WR2', 'WR3'],
+    'TE': ['TE1', 'TE2'],
+}
+LINEUP_SLOTS = ('QB', 'RB1', 'RB2', 'RB3', 'WR1', 'WR2', 'WR3', 'TE1', 'TE2')
+
+PLAYOFF_WEEKS = ['wildcard', 'divisional', 'championship', 'superbowl']
+
+# Prebuilt row formats for lineup output, shared by console and file
+LINEUP_ROW_FMT = ("{slot:5} | {name:25} | {team:4} | {pos:3} | "
+                  "Proj: {proj:5.1f} | Prob: {prob:.0%} | Value: {eff:5.1f}")
+EMPTY_ROW_FMT = "{slot:5} | {name:25} |"
+
+# Bracket structure: wild card matchups (AFC games first, then NFC),
+# the two bye teams, and bracket seeds for divisional reseeding.
+# BUF and SF appear as opponents even though we carry no roster for them.
+WILDCARD_MATCHUPS = [
+    ('NE', 'LAC'), ('JAX', 'BUF'), ('PIT', 'HOU'),   # AFC
+    ('CHI', 'GB'), ('PHI', 'SF'), ('CAR', 'LAR'),    # NFC
+]
+BYE_TEAMS = ('DEN', 'SEA')  # AFC bye, NFC bye
+BRACKET_SEEDS = {
+    'DEN': 1, 'NE': 2, 'JAX': 3, 'PIT': 4, 'HOU': 5, 'BUF': 6, 'LAC': 7,
+    'SEA': 1, 'CHI': 2, 'PHI': 3, 'CAR': 4, 'LAR': 5, 'SF': 6, 'GB': 7,
+}
+
+
+def _simulate_brackets(wc_pairs, wc_probs, byes, seeds, strength, n_iter):
+    """Monte Carlo the playoff bracket; returns P(team plays in week w).
+
+    Simulates both conference brackets n_iter times: wild card games use the
+    given matchup win probabilities, later rounds are decided by relative team
+    strength, and the bye team hosts the worst remaining seed in the
+    divisional round. Counts how often each team is still playing in each
+    week, which captures the conditional structure (a team only reaches the
+    championship by winning its specific divisional matchup) that the old
+    hand-tuned marginals ignored.
+    """
+    n_teams = len(seeds)
+    counts = np.zeros((n_teams, 4))
+    winners = np.empty(3, dtype=np.int32)
+    finalists = np.empty(2, dtype=np.int32)
+    np.random.seed(12345)
+
+    for _ in range(n_iter):
+        for conf in range(2):
+            base = conf * 3
+            # Wild card round: all six seeded teams play
+            for g in range(3):
+                a = wc_pairs[base + g, 0]
+                b = wc_pairs[base + g, 1]
+                counts[a, 0] += 1
+                counts[b, 0] += 1
+                winners[g] = a if np.random.random() < wc_probs[base + g] else b
+
+            # Divisional round: bye team hosts the worst remaining seed
+            bye = byes[conf]
+            counts[bye, 1] += 1
+            lowest = winners[0]
+            for g in range(3):
+                counts[winners[g], 1] += 1
+                if seeds[winners[g]] > seeds[lowest]:
+                    lowest = winners[g]
+            other_a = np.int32(-1)
+            other_b = np.int32(-1)
+            for g in range(3):
+                if winners[g] != lowest:
+                    if other_a < 0:
+                        other_a = winners[g]
+                    else:
+                        other_b = winners[g]
+
+            p = strength[bye] / (strength[bye] + strength[lowest])
+            div_a = bye if np.random.random() < p else lowest
+            p = strength[other_a] / (strength[other_a] + strength[other_b])
+            div_b = other_a if np.random.random() < p else other_b
+
+            # Championship round
+            counts[div_a, 2] += 1
+            counts[div_b, 2] += 1
+            p = strength[div_a] / (strength[div_a] + strength[div_b])
+            finalists[conf] = div_a if np.random.random() < p else div_b
+
+        # Super Bowl
+        counts[finalists[0], 3] += 1
+        counts[finalists[1], 3] += 1
+
+    return counts / n_iter
+
+
+if numba is not None:
+    _simulate_brackets = numba.njit(cache=True)(_simulate_brackets)
+
+
+def _score_players(proj, team_idx, prob_row, sb_row, penalty):
+    """Inner scoring loop: effective value per player for one week.
+
+    Effective value is projected points times probability of playing; elite
+    players (projection over 15) on strong Super Bowl teams (odds over 0.25)
+    are scaled down by the week's penalty factor to save them for later
+    rounds. Compiled with numba when available; a penalty of 1.0 disables
+    the early-round discount.
+    """
+    val = np.empty(proj.shape[0])
+    for i in range(proj.shape[0]):
+        v = proj[i] * prob_row[team_idx[i]]
+        if penalty < 1.0 and proj[i] > 15.0 and sb_row[team_idx[i]] > 0.25:
+            v *= penalty
+        val[i] = v
+    return val
+
+
+if numba is not None:
+    _score_players = numba.njit(cache=True, fastmath=True)(_score_players)
+else:
+    # Pure-NumPy fallback with the same signature
+    def _score_players(proj, team_idx, prob_row, sb_row, penalty):
+        val = proj * prob_row[team_idx]
+        if penalty < 1.0:
+            elite = (proj > 15.0) & (sb_row[team_idx] > 0.25)
+            val = np.where(elite, val * penalty, val)
+        return val
+
+# Integer position ids used by the vectorized scorer (struct-of-arrays layout)
+POS_IDS = {'QB': 0, 'RB': 1, 'WR': 2, 'TE': 3}
+
+@dataclass(slots=True)
 class Player:
     name: str
     team: str
@@ -35,24 +177,22 @@ class Player:
     fumbles_recovered: int = 0
     fpts_per_game: float = 0
     total_fpts: float = 0
-    used: bool = False
-    
-    def calculate_playoff_projection(self, te_premium: bool = False) -> float:
-        """Calculate projected fantasy points for a single playoff game"""
-        # Use their season average as projection
-        points = self.fpts_per_game
-        
-        # Apply TE premium if applicable
-        if te_premium and self.position == 'TE':
-            # TE gets 1.5 PPR instead of 1.0 PPR
-            # Need to recalculate with the extra 0.5 per reception
-            additional_points = self.receptions * 0.5 / self.games_played if self.games_played > 0 else 0
-            points += additional_points
-        
-        return points
+    _te_bonus: float = field(init=False, repr=False, default=0.0)
+    _proj: float = field(init=False, repr=False, default=0.0)
 
+    def __post_init__(self):
+        # Stats never change after load, so hoist the TE premium division and
+        # position branch out of every projection call
+        self._te_bonus = (0.5 * self.receptions / self.games_played
+                          if self.position == 'TE' and self.games_played > 0 else 0.0)
+        self._proj = self.fpts_per_game + self._te_bonus
 
-@dataclass
+    def calculate_playoff_projection(self) -> float:
+        """Projected fantasy points for a single playoff game (memoized at load)"""
+        return self._proj
+
+
+@dataclass(slots=True)
 class Team:
     name: str
     seed: int
@@ -60,20 +200,15 @@ class Team:
     players: List[Player] = field(default_factory=list)
     eliminated: bool = False
     bye_week: bool = False
-    
-    def get_available_players(self) -> List[Player]:
-        """Get players that haven't been used yet"""
-        if self.eliminated:
-            return []
-        return [p for p in self.players if not p.used]
 
 
 class PlayoffOptimizer:
     def __init__(self):
         self.teams: Dict[str, Team] = {}
         self.all_players: List[Player] = []
-        self.used_players: List[Player] = []
+        self.used_players: List[int] = []  # indices into all_players, in pick order
         self.lineups: Dict[str, Dict] = {}
+        self._elim_set: Set[str] = set()
         
         # Team advancement probabilities based on predictions
         # Wild Card round winners based on predictions
@@ -130,105 +265,203 @@ class PlayoffOptimizer:
             }
         }
         
-    def load_team_data(self, csv_file: str, team_abbr: str, team_seed: int, conference: str):
-        """Load player data from a team's CSV file"""
+    def load_team_data(self, csv_file: str, team_abbr: str, team_seed: int,
+                       conference: str) -> Optional[Team]:
+        """Load player data from a team's CSV file.
+
+        Returns the populated Team without touching shared optimizer state,
+        so loads can run concurrently; the caller merges the results.
+        """
         team = Team(name=team_abbr, seed=team_seed, conference=conference)
         
         # Broncos and Seahawks have first-round byes
         if team_abbr in ['DEN', 'SEA']:
             team.bye_week = True
         
-        with open(csv_file, 'r') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-            
-            # Skip first row (category headers), second row is column names
-            if len(rows) < 3:
-                return
-            
-            # Column indices: RK, NAME, TEAM, POS, GP, YDS(pass), TD(pass), INT(pass), 
-            #                 YDS(rush), TD(rush), REC, YDS(rec), TD(rec), SCK, INT(def), FF, FR, FPTS/G, FPTS
-            for row in rows[2:]:  # Skip first 2 header rows
-                if len(row) < 19:
-                    continue
-                
-                try:
-                    name = row[1].strip()
-                    pos = row[3].strip()
-                    
-                    if not name or not pos:
-                        continue
-                    
-                    player = Player(
-                        name=name,
-                        team=team_abbr,
-                        position=pos,
-                        games_played=int(row[4]) if row[4] else 0,
-                        passing_yards=float(row[5]) if row[5] else 0,
-                        passing_tds=int(row[6]) if row[6] else 0,
-                        passing_ints=int(row[7]) if row[7] else 0,
-                        rushing_yards=float(row[8]) if row[8] else 0,
-                        rushing_tds=int(row[9]) if row[9] else 0,
-                        receptions=int(row[10]) if row[10] else 0,
-                        receiving_yards=float(row[11]) if row[11] else 0,
-                        receiving_tds=int(row[12]) if row[12] else 0,
-                        sacks=float(row[13]) if row[13] else 0,
-                        defense_ints=int(row[14]) if row[14] else 0,
-                        fumbles_forced=int(row[15]) if row[15] else 0,
-                        fumbles_recovered=int(row[16]) if row[16] else 0,
-                        fpts_per_game=float(row[17]) if row[17] else 0,
-                        total_fpts=float(row[18]) if row[18] else 0,
-                    )
-                    
-                    # Only add players with significant fantasy production
-                    if player.fpts_per_game > 5.0 or player.position in ['QB', 'TE']:
-                        team.players.append(player)
-                        self.all_players.append(player)
-                        
-                except (ValueError, IndexError) as e:
-                    continue
-        
-        self.teams[team_abbr] = team
+        # Bulk-parse with pandas: the C CSV engine does all the tokenizing,
+        # so we avoid per-cell int()/float() conversion in a Python loop.
+        # Column indices: RK, NAME, TEAM, POS, GP, YDS(pass), TD(pass), INT(pass),
+        #                 YDS(rush), TD(rush), REC, YDS(rec), TD(rec), SCK, INT(def), FF, FR, FPTS/G, FPTS
+        # The stats sheets are plain ASCII: latin-1 decodes byte-for-byte with
+        # no UTF-8 state machine (and can't fail on a stray byte), and
+        # memory-mapping the file skips buffered read syscalls
+        df = pd.read_csv(csv_file, skiprows=2, header=None, usecols=range(19),
+                         dtype=str, keep_default_na=False,
+                         encoding='latin-1', memory_map=True)
+        if df.empty:
+            return None
+
+        # Coerce all 15 stat columns in one pass into a contiguous float
+        # block (empty/garbage cells become 0); columns are GP, passing
+        # YDS/TD/INT, rushing YDS/TD, REC, receiving YDS/TD, SCK, INT(def),
+        # FF, FR, FPTS/G, FPTS
+        names = df[1].str.strip().to_numpy()
+        positions = df[3].str.strip().to_numpy()
+        stats = (df.loc[:, 4:18].apply(pd.to_numeric, errors='coerce')
+                 .fillna(0.0).to_numpy(dtype=np.float64))
+
+        # Drop rows without a name/position, then keep only players with
+        # significant fantasy production
+        keep = ((names != '') & (positions != '')
+                & ((stats[:, 13] > 5.0) | np.isin(positions, ['QB', 'TE'])))
+
+        for name, pos, row in zip(names[keep], positions[keep], stats[keep]):
+            player = Player(
+                name=name,
+                team=team_abbr,
+                position=pos,
+                games_played=int(row[0]),
+                passing_yards=float(row[1]),
+                passing_tds=int(row[2]),
+                passing_ints=int(row[3]),
+                rushing_yards=float(row[4]),
+                rushing_tds=int(row[5]),
+                receptions=int(row[6]),
+                receiving_yards=float(row[7]),
+                receiving_tds=int(row[8]),
+                sacks=float(row[9]),
+                defense_ints=int(row[10]),
+                fumbles_forced=int(row[11]),
+                fumbles_recovered=int(row[12]),
+                fpts_per_game=float(row[13]),
+                total_fpts=float(row[14]),
+            )
+            team.players.append(player)
+
+        return team
         
     def load_all_teams(self):
         """Load data for all playoff teams"""
         base_path = '/home/runner/work/fantasy2/fantasy2'
         
-        # AFC Teams
-        self.load_team_data(f'{base_path}/DenverBroncosStats - Sheet1 (1).csv', 'DEN', 1, 'AFC')
-        self.load_team_data(f'{base_path}/NewEnglandPatriotsStats - Sheet1.csv', 'NE', 2, 'AFC')
-        self.load_team_data(f'{base_path}/JacksonvilleJaguarsStats - Sheet1.csv', 'JAX', 3, 'AFC')
-        self.load_team_data(f'{base_path}/PittsburghSteelersStats - Sheet1.csv', 'PIT', 4, 'AFC')
-        self.load_team_data(f'{base_path}/HoustanTexansStats - Sheet1.csv', 'HOU', 5, 'AFC')  # Note: filename has typo
-        self.load_team_data(f'{base_path}/LosAngelesChargers.csv', 'LAC', 6, 'AFC')
-        
-        # NFC Teams
-        self.load_team_data(f'{base_path}/SeattleSeahawksStats - Sheet1.csv', 'SEA', 1, 'NFC')
-        self.load_team_data(f'{base_path}/ChicagoBearsStats - Sheet1.csv', 'CHI', 2, 'NFC')
-        self.load_team_data(f'{base_path}/PhilidelphiaEaglesStats - Sheet1.csv', 'PHI', 3, 'NFC')  # Note: filename has typo
-        self.load_team_data(f'{base_path}/CarolinaPanthersStats - Sheet1 (1).csv', 'CAR', 4, 'NFC')
-        self.load_team_data(f'{base_path}/LosAngelesRamsStats - Sheet1.csv', 'LAR', 5, 'NFC')
-        self.load_team_data(f'{base_path}/GreenBayPackersStats- Sheet1 (1).csv', 'GB', 7, 'NFC')
-        
+        jobs = [
+            # AFC Teams
+            (f'{base_path}/DenverBroncosStats - Sheet1 (1).csv', 'DEN', 1, 'AFC'),
+            (f'{base_path}/NewEnglandPatriotsStats - Sheet1.csv', 'NE', 2, 'AFC'),
+            (f'{base_path}/JacksonvilleJaguarsStats - Sheet1.csv', 'JAX', 3, 'AFC'),
+            (f'{base_path}/PittsburghSteelersStats - Sheet1.csv', 'PIT', 4, 'AFC'),
+            (f'{base_path}/HoustanTexansStats - Sheet1.csv', 'HOU', 5, 'AFC'),  # Note: filename has typo
+            (f'{base_path}/LosAngelesChargers.csv', 'LAC', 6, 'AFC'),
+            # NFC Teams
+            (f'{base_path}/SeattleSeahawksStats - Sheet1.csv', 'SEA', 1, 'NFC'),
+            (f'{base_path}/ChicagoBearsStats - Sheet1.csv', 'CHI', 2, 'NFC'),
+            (f'{base_path}/PhilidelphiaEaglesStats - Sheet1.csv', 'PHI', 3, 'NFC'),  # Note: filename has typo
+            (f'{base_path}/CarolinaPanthersStats - Sheet1 (1).csv', 'CAR', 4, 'NFC'),
+            (f'{base_path}/LosAngelesRamsStats - Sheet1.csv', 'LAR', 5, 'NFC'),
+            (f'{base_path}/GreenBayPackersStats- Sheet1 (1).csv', 'GB', 7, 'NFC'),
+        ]
+
+        # Parse the 12 files in parallel (pandas releases the GIL in its C
+        # tokenizer), then merge in job order so player ordering — and with
+        # it the struct-of-arrays layout — stays deterministic
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda args: self.load_team_data(*args), jobs))
+
+        for team in results:
+            if team is not None:
+                self.teams[team.name] = team
+                self.all_players.extend(team.players)
+
+        # Build the struct-of-arrays view of the player pool for vectorized scoring
+        self._build_arrays()
+
+    def _build_arrays(self):
+        """Build NumPy struct-of-arrays over the player pool.
+
+        Instead of touching Player attributes and probability dicts per player
+        per week, the scorer works on parallel ndarrays built once after load:
+        one handful of array ops replaces N attribute accesses and dict lookups.
+        """
+        players = self.all_players
+        self.week_id = {'wildcard': 0, 'divisional': 1, 'championship': 2, 'superbowl': 3}
+        self.team_order = sorted(self.teams)
+        self.team_id = {abbr: i for i, abbr in enumerate(self.team_order)}
+
+        self.fpg = np.array([p.fpts_per_game for p in players], dtype=np.float64)
+        self.proj = np.array([p._proj for p in players], dtype=np.float64)
+        self.rec = np.array([p.receptions for p in players], dtype=np.float64)
+        self.gp = np.array([p.games_played for p in players], dtype=np.float64)
+        self.pos = np.array([POS_IDS.get(p.position, -1) for p in players], dtype=np.int8)
+        self.team_idx = np.array([self.team_id[p.team] for p in players], dtype=np.int16)
+        self.used = np.zeros(len(players), dtype=bool)
+        self.eliminated = np.zeros(len(self.team_order), dtype=bool)
+
+        # Per-position player index, computed once instead of rescanning the
+        # whole pool four times per week
+        self.by_pos = {pos: np.where(self.pos == pid)[0] for pos, pid in POS_IDS.items()}
+
+        # Dense (week, team) advancement probability table, estimated by
+        # Monte Carlo over the actual bracket instead of hand-tuned marginals.
+        # Bye teams sit out the wild card round, so their wildcard cell is 0.
+        n_iter = 1_000_000 if numba is not None else 10_000
+        self._prob = self._monte_carlo_probabilities(n_iter)
+
+        # Warm the scorer JIT with a one-element call so the first real
+        # scoring pass doesn't pay the compile cost
+        _score_players(self.proj[:1], self.team_idx[:1],
+                       self._prob[0], self._prob[3], 1.0)
+
+        # The elimination schedule is deterministic given the probability
+        # table, so derive it once: predicted wild card losers drop out when
+        # 'divisional' is processed, then only teams with real championship /
+        # Super Bowl odds survive the later cuts
+        champ = self._prob[self.week_id['championship']]
+        sb = self._prob[self.week_id['superbowl']]
+        self._elim_after = {
+            'divisional': {abbr for abbr in ('LAC', 'JAX', 'PIT', 'GB', 'SF', 'CAR')
+                           if abbr in self.teams},
+            'championship': {abbr for abbr in self.teams
+                             if champ[self.team_id[abbr]] < 0.18},
+            'superbowl': {abbr for abbr in self.teams
+                          if sb[self.team_id[abbr]] < 0.08},
+        }
+
+    def _monte_carlo_probabilities(self, n_iter: int) -> np.ndarray:
+        """Estimate P(team plays in each week) by simulating the bracket"""
+        # Simulation id space: loaded teams plus roster-less opponents
+        sim_teams = list(self.team_order)
+        for a, b in WILDCARD_MATCHUPS:
+            for abbr in (a, b):
+                if abbr not in sim_teams:
+                    sim_teams.append(abbr)
+        sim_id = {abbr: i for i, abbr in enumerate(sim_teams)}
+
+        # Wild card games use the predicted matchup win probabilities; later
+        # rounds are decided by Super Bowl odds as a relative strength rating
+        wc = self.team_probabilities['wildcard']
+        sb = self.team_probabilities['superbowl']
+        wc_pairs = np.array([[sim_id[a], sim_id[b]] for a, b in WILDCARD_MATCHUPS],
+                            dtype=np.int32)
+        wc_probs = np.array([wc.get(a, 0.5) / (wc.get(a, 0.5) + wc.get(b, 0.5))
+                             for a, b in WILDCARD_MATCHUPS])
+        byes = np.array([sim_id[abbr] for abbr in BYE_TEAMS], dtype=np.int32)
+        seeds = np.array([BRACKET_SEEDS.get(abbr, 8) for abbr in sim_teams],
+                         dtype=np.int32)
+        strength = np.array([sb.get(abbr, 0.02) for abbr in sim_teams])
+
+        counts = _simulate_brackets(wc_pairs, wc_probs, byes, seeds, strength, n_iter)
+
+        prob = np.zeros((4, len(self.team_order)), dtype=np.float32)
+        for abbr, i in self.team_id.items():
+            prob[:, i] = counts[sim_id[abbr], :]
+        return prob
+
     def calculate_player_value(self, player: Player, week: str) -> float:
         """Calculate effective player value considering advancement probability"""
-        base_projection = player.calculate_playoff_projection(te_premium=(player.position == 'TE'))
-        team_prob = self.team_probabilities.get(week, {}).get(player.team, 0)
-        
-        # Teams on bye in wild card round don't play
-        if week == 'wildcard' and player.team in ['DEN', 'SEA']:
-            return 0.0
-        
+        base_projection = player._proj
+        team_prob = self._prob[self.week_id[week], self.team_id[player.team]]
+
         # Effective value = projected points × probability of playing
+        # (bye teams have probability 0 in the wild card round)
         effective_value = base_projection * team_prob
-        
+
         # Add future value adjustment for elite players on strong teams
         if week in ['wildcard', 'divisional']:
             # Check if this is an elite player (top tier production)
             is_elite = base_projection > 15.0
-            
+
             # Check if team has strong Super Bowl odds
-            sb_prob = self.team_probabilities['superbowl'].get(player.team, 0)
+            sb_prob = self._prob[self.week_id['superbowl'], self.team_id[player.team]]
             strong_team = sb_prob > 0.25
             
             if is_elite and strong_team:
@@ -240,97 +473,128 @@ class PlayoffOptimizer:
         
         return effective_value
     
-    def get_available_players_by_position(self, position: str) -> List[Tuple[Player, float]]:
-        """Get available players for a position with their current week value"""
-        players = []
-        for player in self.all_players:
-            if not player.used and player.position == position and not self.teams[player.team].eliminated:
-                players.append(player)
-        return players
+    def get_available_players_by_position(self, position: str) -> np.ndarray:
+        """Indices of available players at a position (unused, team still alive)"""
+        idx = self.by_pos[position]
+        return idx[~self.used[idx] & ~self.eliminated[self.team_idx[idx]]]
     
     def select_optimal_lineup(self, week: str) -> Dict:
         """Select the optimal lineup for a given week"""
         lineup = {
             'week': week,
-            'QB': None,
-            'RB1': None,
-            'RB2': None,
-            'RB3': None,
-            'WR1': None,
-            'WR2': None,
-            'WR3': None,
-            'TE1': None,
-            'TE2': None,
-            'total_projected': 0
+            'total_projected': 0,
+            'players': {slot: None for slot in LINEUP_SLOTS},
         }
         
-        # Get all available players with their values for this week
-        available_qbs = [(p, self.calculate_player_value(p, week)) for p in self.get_available_players_by_position('QB')]
-        available_rbs = [(p, self.calculate_player_value(p, week)) for p in self.get_available_players_by_position('RB')]
-        available_wrs = [(p, self.calculate_player_value(p, week)) for p in self.get_available_players_by_position('WR')]
-        available_tes = [(p, self.calculate_player_value(p, week)) for p in self.get_available_players_by_position('TE')]
-        
-        # Sort by value (descending)
-        available_qbs.sort(key=lambda x: x[1], reverse=True)
-        available_rbs.sort(key=lambda x: x[1], reverse=True)
-        available_wrs.sort(key=lambda x: x[1], reverse=True)
-        available_tes.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select best QB
-        if available_qbs:
-            lineup['QB'] = available_qbs[0][0]
-            lineup['QB'].used = True
-            self.used_players.append(lineup['QB'])
-        
-        # Select best 3 RBs
-        for i, slot in enumerate(['RB1', 'RB2', 'RB3']):
-            if i < len(available_rbs):
-                lineup[slot] = available_rbs[i][0]
-                lineup[slot].used = True
-                self.used_players.append(lineup[slot])
-        
-        # Select best 3 WRs
-        for i, slot in enumerate(['WR1', 'WR2', 'WR3']):
-            if i < len(available_wrs):
-                lineup[slot] = available_wrs[i][0]
-                lineup[slot].used = True
-                self.used_players.append(lineup[slot])
-        
-        # Select best 2 TEs
-        for i, slot in enumerate(['TE1', 'TE2']):
-            if i < len(available_tes):
-                lineup[slot] = available_tes[i][0]
-                lineup[slot].used = True
-                self.used_players.append(lineup[slot])
-        
-        # Calculate total projected points
-        for slot, player in lineup.items():
-            if player and slot != 'week' and slot != 'total_projected':
-                lineup['total_projected'] += player.calculate_playoff_projection(te_premium=(player.position == 'TE'))
-        
+        # Score every player for this week in one vectorized pass
+        proj, val = self._score_week(week)
+        prob_row = self._prob[self.week_id[week]]
+
+        # Pick the top-k available players per position: argpartition finds
+        # the k best in O(N), then only those k are sorted for slot order
+        for position, slots in POSITION_SLOTS.items():
+            idx = self.get_available_players_by_position(position)
+            vals = val[idx]
+            k = min(len(slots), len(idx))
+            if 0 < k < len(idx):
+                top = np.argpartition(vals, -k)[-k:]
+                idx, vals = idx[top], vals[top]
+            order = idx[np.argsort(-vals)]
+            for slot, i in zip(slots, order):
+                # Slots hold (player, proj, prob, effective) so the output
+                # step never recomputes projections or probabilities
+                prob = prob_row[self.team_idx[i]]
+                lineup['players'][slot] = (self.all_players[i], proj[i], prob,
+                                           proj[i] * prob)
+                self.used[i] = True
+                self.used_players.append(i)
+                lineup['total_projected'] += proj[i]
+
         return lineup
-    
+
+    def _score_week(self, week: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Score all players for one week: (projections, effective values)"""
+        # Heavy early-round penalty for elite players on strong Super Bowl
+        # teams, to encourage saving them for later; no discount otherwise
+        penalty = {'wildcard': 0.4, 'divisional': 0.65}.get(week, 1.0)
+        val = _score_players(self.proj, self.team_idx,
+                             self._prob[self.week_id[week]],
+                             self._prob[self.week_id['superbowl']], penalty)
+        return self.proj, val
+
+    def select_lineups_ilp(self) -> Dict[str, Dict]:
+        """Solve all four weeks at once as an integer linear program.
+
+        The greedy week-by-week picker is suboptimal for the use-each-player-
+        once constraint; formulating it as an ILP (binary x[player, week],
+        each player used at most once, fixed slot counts per week/position,
+        maximize total effective value) gives the true optimum and solves in
+        milliseconds for this pool size with CBC.
+        """
+        n_players = len(self.all_players)
+        n_weeks = len(PLAYOFF_WEEKS)
+
+        # Effective values per week, honoring the elimination schedule
+        values = np.zeros((n_players, n_weeks))
+        playable = np.zeros((n_players, n_weeks), dtype=bool)
+        for w, week in enumerate(PLAYOFF_WEEKS):
+            _, values[:, w] = self._score_week(week)
+            playable[:, w] = ~self.eliminated[self.team_idx]
+            self.eliminate_teams(week)
+
+        pos_idx = self.by_pos
+
+        problem = pulp.LpProblem('playoff_lineups', pulp.LpMaximize)
+        x = {(i, w): pulp.LpVariable(f'x_{i}_{w}', cat='Binary')
+             for pos in POSITION_SLOTS for i in pos_idx[pos]
+             for w in range(n_weeks) if playable[i, w]}
+
+        # Each player can only be used once across all weeks
+        for pos in POSITION_SLOTS:
+            for i in pos_idx[pos]:
+                problem += pulp.lpSum(x[i, w] for w in range(n_weeks) if (i, w) in x) <= 1
+
+        # Fill every slot each week
+        for w in range(n_weeks):
+            for pos, slots in POSITION_SLOTS.items():
+                problem += pulp.lpSum(x[i, w] for i in pos_idx[pos] if (i, w) in x) == len(slots)
+
+        problem += pulp.lpSum(values[i, w] * x[i, w] for (i, w) in x)
+        problem.solve(pulp.PULP_CBC_CMD(msg=0))
+
+        # Read the solution back into per-week lineups
+        lineups = {}
+        for w, week in enumerate(PLAYOFF_WEEKS):
+            lineup = {
+                'week': week,
+                'total_projected': 0,
+                'players': {slot: None for slot in LINEUP_SLOTS},
+            }
+            prob_row = self._prob[self.week_id[week]]
+            for pos, slots in POSITION_SLOTS.items():
+                chosen = [i for i in pos_idx[pos]
+                          if (i, w) in x and x[i, w].value() > 0.5]
+                chosen.sort(key=lambda i: -values[i, w])
+                for slot, i in zip(slots, chosen):
+                    prob = prob_row[self.team_idx[i]]
+                    lineup['players'][slot] = (self.all_players[i], self.proj[i],
+                                               prob, self.proj[i] * prob)
+                    self.used[i] = True
+                    self.used_players.append(i)
+                    lineup['total_projected'] += self.proj[i]
+            lineups[week] = lineup
+        return lineups
+
+    def _mark_eliminated(self, team_abbr: str):
+        """Mark a team eliminated in all three views (Team, mask, set)"""
+        self.teams[team_abbr].eliminated = True
+        self.eliminated[self.team_id[team_abbr]] = True
+        self._elim_set.add(team_abbr)
+
     def eliminate_teams(self, week: str):
-        """Mark teams as eliminated based on predictions"""
-        if week == 'divisional':
-            # Eliminate wild card losers based on predictions
-            # Keep: LAR (beat CAR), CHI (beat GB), PHI (beat SF), NE (beat LAC), BUF (beat JAX), HOU (beat PIT)
-            losers = ['LAC', 'JAX', 'PIT', 'GB', 'SF', 'CAR']
-            for team_abbr in losers:
-                if team_abbr in self.teams:
-                    self.teams[team_abbr].eliminated = True
-        elif week == 'championship':
-            # Eliminate divisional round losers
-            # Keep top 4 teams likely to make championship: DEN, SEA, LAR/PHI (NFC), NE/BUF/HOU (AFC)
-            # More conservative - only eliminate teams with very low probability
-            for team_abbr, team in self.teams.items():
-                if self.team_probabilities['championship'].get(team_abbr, 0) < 0.18:
-                    team.eliminated = True
-        elif week == 'superbowl':
-            # Keep only teams with highest Super Bowl probability
-            for team_abbr, team in self.teams.items():
-                if self.team_probabilities['superbowl'].get(team_abbr, 0) < 0.08:
-                    team.eliminated = True
+        """Mark teams as eliminated per the precomputed schedule"""
+        for team_abbr in self._elim_after.get(week, ()):
+            self._mark_eliminated(team_abbr)
     
     def run_optimization(self):
         """Run the full optimization across all playoff weeks"""
@@ -343,8 +607,18 @@ class PlayoffOptimizer:
         print(f"Loaded {len(self.all_players)} players from {len(self.teams)} teams")
         print("\nTeams with first-round bye: Denver Broncos, Seattle Seahawks")
         
-        weeks = ['wildcard', 'divisional', 'championship', 'superbowl']
-        
+        weeks = PLAYOFF_WEEKS
+
+        # Solve all four weeks globally when an ILP solver is available,
+        # otherwise fall back to the week-by-week greedy picker
+        if pulp is not None:
+            self.lineups = self.select_lineups_ilp()
+        else:
+            for week in weeks:
+                self.lineups[week] = self.select_optimal_lineup(week)
+                # Eliminate losing teams before next week
+                self.eliminate_teams(week)
+
         output_lines = []
         output_lines.append("=" * 80)
         output_lines.append("PLAYOFF FANTASY LINEUP OPTIMIZER RESULTS")
@@ -357,75 +631,87 @@ class PlayoffOptimizer:
         output_lines.append("- Save elite players on Super Bowl contenders for later rounds")
         output_lines.append("\n")
         
+        # Console output is accumulated and flushed with a single print at
+        # the end instead of one write syscall per line
+        console = []
+
         for week in weeks:
-            print("\n" + "=" * 80)
-            print(f"OPTIMIZING FOR: {week.upper()} ROUND")
-            print("=" * 80)
-            
-            lineup = self.select_optimal_lineup(week)
-            self.lineups[week] = lineup
-            
+            console.append("\n" + "=" * 80)
+            console.append(f"OPTIMIZING FOR: {week.upper()} ROUND")
+            console.append("=" * 80)
+
+            lineup = self.lineups[week]
+
             output_lines.append("=" * 80)
             output_lines.append(f"{week.upper()} ROUND LINEUP")
             output_lines.append("=" * 80)
-            
-            print(f"\nOptimal Lineup for {week.upper()} Round:")
-            print("-" * 80)
+
+            console.append(f"\nOptimal Lineup for {week.upper()} Round:")
+            console.append("-" * 80)
             output_lines.append("")
-            
-            for slot in ['QB', 'RB1', 'RB2', 'RB3', 'WR1', 'WR2', 'WR3', 'TE1', 'TE2']:
-                player = lineup[slot]
-                if player:
-                    proj = player.calculate_playoff_projection(te_premium=(player.position == 'TE'))
-                    prob = self.team_probabilities[week].get(player.team, 0)
-                    effective = proj * prob
-                    line = f"{slot:5} | {player.name:25} | {player.team:4} | {player.position:3} | Proj: {proj:5.1f} | Prob: {prob:.0%} | Value: {effective:5.1f}"
-                    print(line)
-                    output_lines.append(line)
+
+            row = {}  # one dict reused across the slot loop
+            for slot, entry in lineup['players'].items():
+                row['slot'] = slot
+                if entry:
+                    # Projection/probability/value were computed during
+                    # selection; just unpack them
+                    player, proj, prob, effective = entry
+                    row['name'] = player.name
+                    row['team'] = player.team
+                    row['pos'] = player.position
+                    row['proj'] = proj
+                    row['prob'] = prob
+                    row['eff'] = effective
+                    line = LINEUP_ROW_FMT.format_map(row)
                 else:
-                    line = f"{slot:5} | {'EMPTY':25} |"
-                    print(line)
-                    output_lines.append(line)
-            
-            print("-" * 80)
-            print(f"Total Projected Points: {lineup['total_projected']:.1f}")
+                    row['name'] = 'EMPTY'
+                    line = EMPTY_ROW_FMT.format_map(row)
+                # Build each row once, use it for both console and file
+                console.append(line)
+                output_lines.append(line)
+
+            total_line = f"Total Projected Points: {lineup['total_projected']:.1f}"
+            console.append("-" * 80)
+            console.append(total_line)
             output_lines.append("-" * 80)
-            output_lines.append(f"Total Projected Points: {lineup['total_projected']:.1f}")
+            output_lines.append(total_line)
             output_lines.append("")
-            
-            # Eliminate losing teams before next week
-            self.eliminate_teams(week)
-        
+
         # Print summary
-        print("\n" + "=" * 80)
-        print("SUMMARY")
-        print("=" * 80)
         total_points = sum(lineup['total_projected'] for lineup in self.lineups.values())
-        print(f"\nTotal Projected Points Across All Weeks: {total_points:.1f}")
-        print(f"Players Used: {len(self.used_players)}")
-        
+        total_line = f"\nTotal Projected Points Across All Weeks: {total_points:.1f}"
+        used_line = f"Players Used: {len(self.used_players)}"
+
+        console.append("\n" + "=" * 80)
+        console.append("SUMMARY")
+        console.append("=" * 80)
+        console.append(total_line)
+        console.append(used_line)
+
         output_lines.append("=" * 80)
         output_lines.append("SUMMARY")
         output_lines.append("=" * 80)
-        output_lines.append(f"\nTotal Projected Points Across All Weeks: {total_points:.1f}")
-        output_lines.append(f"Players Used: {len(self.used_players)}")
-        
+        output_lines.append(total_line)
+        output_lines.append(used_line)
+
         # Print week by week breakdown
-        print("\nWeek-by-Week Breakdown:")
+        console.append("\nWeek-by-Week Breakdown:")
         output_lines.append("\nWeek-by-Week Breakdown:")
         for week in weeks:
             lineup = self.lineups[week]
             line = f"{week.capitalize():15} | {lineup['total_projected']:6.1f} points"
-            print(line)
+            console.append(line)
             output_lines.append(line)
-        
+
         # Save to file
         with open('/home/runner/work/fantasy2/fantasy2/optimal_lineups.txt', 'w') as f:
             f.write('\n'.join(output_lines))
-        
-        print("\n" + "=" * 80)
-        print("Results saved to: optimal_lineups.txt")
-        print("=" * 80)
+
+        console.append("\n" + "=" * 80)
+        console.append("Results saved to: optimal_lineups.txt")
+        console.append("=" * 80)
+        print('\n'.join(console))
 
 
 def main():